@@ -1,19 +1,11 @@
 
 import os
 import argparse
+import hashlib
+import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from lhcbstyle import LHCbStyle
-import matplotlib.pyplot as plt
-import matplotlib.cm
-from matplotlib.colors import ListedColormap
-from matplotlib import colormaps
-import awkward as ak
-import sys
-from iminuit import Minuit
-import matplotlib.pyplot as plt
-import mplhep; mplhep.style.use("LHCb2")
-from scipy.stats import chi2, ks_2samp
-from matplotlib.patches import Rectangle
 
 # - - - - - - - FUNCTIONS - - - - - - - #
 
@@ -107,13 +99,79 @@ def dir_path(string):
     else:
         raise NotADirectoryError(string)
 
-def read_asymmetry_values():
+def read_asymmetry_values(args):
     with open(f'{args.path}/final_asymmetries_{args.scheme}_{args.year}_{args.size}.txt') as f:
         lines = f.readlines()
         unbinned_asymm = float(lines[0])
         unbinned_asymm_error = float(lines[1])
         f.close()
     return unbinned_asymm, unbinned_asymm_error
+
+def load_col(paths, n_rows=2):
+    '''
+    Reads the first n_rows values of each of the given text files. The files are read
+    concurrently by a small thread pool, as each read is independent.
+    Returns an array of shape (len(paths), n_rows), with one row per file.
+    '''
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        rows = list(executor.map(lambda p: np.loadtxt(p, max_rows=n_rows), paths))
+    return np.vstack(rows)
+
+def get_cache_key(paths):
+    '''
+    Builds a key identifying the contents of the given input files: a hash of the paths
+    and their modification times. Editing any input file changes the key.
+    '''
+    return hashlib.sha1(repr(sorted((p, os.path.getmtime(p)) for p in paths)).encode()).hexdigest()
+
+def read_cache(cache_file, key):
+    '''
+    Reads the cache file written by a previous run, if it exists and was built from input files
+    with the given key. Returns the asymmetries array and the bin edges, or None otherwise.
+    A cache file that cannot be read, e.g. one left truncated by an interrupted run, is treated
+    as a miss.
+    '''
+    if not os.path.isfile(cache_file):
+        return None
+    try:
+        with np.load(cache_file) as data:
+            if str(data['key']) != key:
+                return None
+            return data['asymmetries'], data['bin_lines']
+    except (OSError, ValueError, EOFError, KeyError, zipfile.BadZipFile):
+        return None
+
+def write_cache(cache_file, key, asymmetries, bin_lines):
+    '''
+    Writes the values read from the input files to the cache file, together with their key.
+    The file is written to a temporary file in the same directory and then moved into place,
+    so an interrupted run never leaves a partial cache file behind.
+    '''
+    cache_dir = os.path.dirname(cache_file)
+    os.makedirs(cache_dir, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=cache_dir, suffix='.npz', delete=False) as tmp:
+        tmp_name = tmp.name
+        try:
+            np.savez(tmp, key=key, asymmetries=asymmetries, bin_lines=bin_lines)
+        except BaseException:
+            tmp.close()
+            os.remove(tmp_name)
+            raise
+    os.replace(tmp_name, cache_file)
+
+def setup_plotting():
+    '''
+    Imports the plotting modules and applies the LHCb style. This is deferred until plotting
+    starts so that argument parsing and reading the input files do not pay the import cost.
+
+    Returns the pyplot module, the Rectangle patch class and the PolyCollection class.
+    '''
+    import matplotlib.pyplot as plt
+    import mplhep; mplhep.style.use("LHCb2")
+    from matplotlib.patches import Rectangle
+    from matplotlib.collections import PolyCollection
+    return plt, Rectangle, PolyCollection
+
 def getCumY(yy, yKS):
     # sort the data and build cumulative distribution on the set of y axis points
     yy.sort()
@@ -126,225 +184,205 @@ def getCumY(yy, yKS):
             cKS.append(cumY)
             n += 1
         cumY += inc
-    for nn in range(nSamples+1-len(cKS)):
+    for nn in range(len(yKS)-len(cKS)):
         cKS.append(cumY)
     return cKS
 # - - - - - - - MAIN BODY - - - - - - - #
-args = parse_arguments()
-
-unbinned_asymm, unbinned_asymm_error = read_asymmetry_values()
-
-asymmetry = np.array([])
-asymmetry_error = np.array([])
-for j in range(0,10):
-    bin_num = str(j)
-    with open(f'{args.asymm_path}/asymmetries_{args.year}_{args.size}_bin{bin_num}.txt') as f:
-        lines = f.readlines()
-        A_prod = float(lines[0])
-        A_prod_err = float(lines[1])
-    f.close()
-    asymmetry = np.append(asymmetry, A_prod)
-    asymmetry_error = np.append(asymmetry_error, A_prod_err)
-
-simulated_asymmetry = np.array([])
-simulated_asymmetry_error = np.array([])
-for j in range(0,10):
-    bin_num = str(j)
-    with open(f'{args.sim_asymm_path}/asymmetries_pythia_{args.scheme}_bin{bin_num}.txt') as f:
-        lines = f.readlines()
-        sim_A_prod = float(lines[0])
-        sim_A_prod_err = float(lines[1])
-    f.close()
-    simulated_asymmetry = np.append(simulated_asymmetry, sim_A_prod)
-    simulated_asymmetry_error = np.append(simulated_asymmetry_error, sim_A_prod_err)
-
-
-x_value =np.array([])
-x_value_error = np.array([])
+def main():
+    args = parse_arguments()
+    # Imported here so that --help and argument errors do not pay the scipy import cost
+    from scipy.stats import chi2, ks_2samp
+
+    unbinned_asymm, unbinned_asymm_error = read_asymmetry_values(args)
+
+    asymm_paths = [f'{args.asymm_path}/asymmetries_{args.year}_{args.size}_bin{j}.txt' for j in range(0,10)]
+    sim_asymm_paths = [f'{args.sim_asymm_path}/asymmetries_pythia_{args.scheme}_bin{j}.txt' for j in range(0,10)]
+    file_path = f"{args.bin_path}/{args.year}_{args.size}_{args.scheme}_bins.txt"  # Replace with the path to your file
+
+    # Reuse the values read on a previous run if none of the input files has changed.
+    # There is one cache file per scheme, year and size, overwritten whenever the inputs change
+    cache_key = get_cache_key(asymm_paths + sim_asymm_paths + [file_path])
+    cache_file = f'{args.path}/.cache/plot_pT_eta_{args.scheme}_{args.year}_{args.size}.npz'
+    cached = read_cache(cache_file, cache_key)
+    if cached is not None:
+        asymmetries, bin_lines = cached
+    else:
+        # Each file holds the asymmetry and its error on the first two lines
+        asymmetries = np.vstack((load_col(asymm_paths).T, load_col(sim_asymm_paths).T))
+        bin_lines = np.loadtxt(file_path)
 
-file_path = f"{args.bin_path}/{args.year}_{args.size}_{args.scheme}_bins.txt"  # Replace with the path to your file
-# Open the file in read mode
-with open(file_path, 'r') as file:
-    # Read all lines from the file and store them in a list
-    bin_lines = [float(line.strip()) for line in file.readlines()]
+        write_cache(cache_file, cache_key, asymmetries, bin_lines)
+    asymmetry, asymmetry_error, simulated_asymmetry, simulated_asymmetry_error = asymmetries
 
-print(bin_lines)
-for i in range(0,10):
     # Get center of bin and width of bin as error
-    x_value_indivual = (bin_lines[i]+bin_lines[i+1])/2
-    x_value_error_indivual = (bin_lines[i+1]) - ((bin_lines[i]+bin_lines[i+1])/2)
-    x_value_error = np.append(x_value_error, x_value_error_indivual)
-    x_value = np.append(x_value, x_value_indivual)
-
-
-if args.scheme == 'pT':
-    x_value = [x / 1000 for x in x_value] # in Gev
-    x_value_error = [x / 1000 for x in x_value_error] # in Gev
-
-
-##########
-bins = len(x_value)
-
-# initialise globally so can print after
-store = {}
-def get_chi2(c: float):
-    chi2 = 0.
-    ndof = -1 # 1 for c
+    x_value = (bin_lines[:-1] + bin_lines[1:]) / 2
+    x_value_error = bin_lines[1:] - x_value
 
-    for i in range(bins):
-        if asymmetry_error[i] == 0:
-            continue
+    print(bin_lines)
 
-        pol0 = c
-        residual = (asymmetry[i] - pol0) / asymmetry_error[i]
 
-        chi2 += residual * residual
-        ndof += 1
-    
-    store["chi2"] = chi2
-    store["ndof"] = ndof
-
-    return chi2
-
-
-
-m = Minuit(get_chi2, c=0) # 0 is initial guess
-result = m.migrad()
-values = list(m.values)
-errors = list(m.errors)
-prob = 1 - chi2.cdf(store["chi2"], store["ndof"])
+    if args.scheme == 'pT':
+        x_value *= 1e-3 # in Gev
+        x_value_error *= 1e-3 # in Gev
 
-result_string = "\n".join((
-    rf"$c = {values[0]:.3f} \pm {errors[0]:.3f}, m=0$",
-    rf"$\chi^{{2}} / $nDOF$ = {store['chi2']:.2f} / {store['ndof']}$",
-    rf"$p = {prob*100:.1f} \%$"
-))
 
+    ##########
+    # Weighted least-squares fit of a constant, solved in closed form
+    # bins with no error do not contribute to the chi2
+    fit_mask = asymmetry_error != 0
+    a = asymmetry[fit_mask]
+    e = asymmetry_error[fit_mask]
+    w = 1.0 / (e * e)
+    c_hat = np.sum(a * w) / np.sum(w)
+    c_err = 1.0 / np.sqrt(np.sum(w))
+    chi2_val = np.sum(((a - c_hat) * np.sqrt(w))**2)
+    ndof = fit_mask.sum() - 1 # 1 for c
+    prob = 1 - chi2.cdf(chi2_val, ndof)
 
-##################
-# Plotting
-fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(15, 12), sharex=True, gridspec_kw={'height_ratios': [3, 1]})
+    result_string = "\n".join((
+        rf"$c = {c_hat:.3f} \pm {c_err:.3f}, m=0$",
+        rf"$\chi^{{2}} / $nDOF$ = {chi2_val:.2f} / {ndof}$",
+        rf"$p = {prob*100:.1f} \%$"
+    ))
 
-ax1.set_ylabel(r'$A_{\mathrm{prod}}$ [%]', fontsize = 50)
-ax1.tick_params(axis='both', which='both', labelsize=30)
 
-line2 = ax1.axhline(unbinned_asymm, color='red', linestyle='solid', linewidth=5)
-fill2 = ax1.axhspan(unbinned_asymm-unbinned_asymm_error, unbinned_asymm+unbinned_asymm_error, color='red', alpha=0.35, lw=0)
-
-Data = ax1.errorbar(x_value, asymmetry, yerr=asymmetry_error,xerr=x_value_error, fmt='o', capsize=5, color = 'black', label = 'Data')
-
-# Fill between simulated error bars
-for i in range(len(x_value)):
-    ax1.fill_between([x_value[i] - x_value_error[i], x_value[i] + x_value_error[i]],
-                    simulated_asymmetry[i] - simulated_asymmetry_error[i],
-                    simulated_asymmetry[i] + simulated_asymmetry_error[i],
-                    color='green', alpha=0.4, linewidth=0)
-    
-extra = Rectangle((0, 0), 1, 1, fc="green", fill=True, edgecolor='none', linewidth=0, alpha=0.4)
-
-# Fit = ax.axhline(values[0], color='purple', linestyle=':', linewidth=5)
-
-if args.scheme == 'pT':
-    ax1.legend([(line2,fill2),Data, extra],[r'Bin integrated result','Data','Pythia'])#, loc='upper right')
-elif args.scheme == 'eta':
-    ax1.legend([(line2,fill2),Data, extra],[r'Bin integrated result','Data','Pythia'])#,='upper right')
-
-file_path = f"{args.path}/result_of_fit.txt"
-with open(file_path, "w") as file:
-  file.write(f"{result_string}")
-
-ratio = (simulated_asymmetry / asymmetry)
-ratio_error = np.sqrt((simulated_asymmetry_error/asymmetry)**2 + ((simulated_asymmetry*asymmetry_error)/(asymmetry)**2)**2)
-
-# Plot residuals against observed data with error bars
-for i, (x, y, xerr, yerr) in enumerate(zip(x_value, ratio, x_value_error, ratio_error)):
-    color = 'black' if (y + yerr < 1) and (y - yerr < 1) else 'black'
-    ax2.errorbar(x, y, xerr=xerr, yerr=yerr, fmt='o', color=color)
-
-# ax2.errorbar(x_value, ratio, xerr=x_value, yerr=ratio_error, fmt='o', color='black')
-
-ax2.axhline(y=1, color='grey', linestyle='--') 
-# ax2.axhline(y=0, color='grey', linestyle='--')  
-# ax2.axhline(y=-3, color='red', linestyle='--')  
-
-if args.scheme == 'pT':
-    ax2.set_xlabel(r'$p_{T}$ [GeV$c^{-1}$]', fontsize = 50)
-elif args.scheme == 'eta':
-    ax2.set_xlabel(r'$\eta$', fontsize = 50)
-ax2.set_ylabel('Ratio', fontsize = 50)
-
-
-
-if args.scheme == 'pT':
-    plt.savefig(f'{args.path}/pT_Asymm_{args.year}_{args.size}.pdf', bbox_inches = "tight")
-elif args.scheme == 'eta':
-    plt.savefig(f'{args.path}/eta_Asymm_{args.year}_{args.size}.pdf', bbox_inches = "tight")
-
-plt.show()
-
-min_value_asymmetry = min(asymmetry.min(), simulated_asymmetry.min())
-max_value_asymmetry = max(asymmetry.max(), simulated_asymmetry.max())
-print(min_value_asymmetry)
-print(max_value_asymmetry)
-
-# y axis points for plotting and evaluation of the difference
-nSamples = 10000
-yKS = np.linspace(min_value_asymmetry, max_value_asymmetry, nSamples+1)
-
-
-cKS1 = getCumY(asymmetry, yKS)
-cKS2 = getCumY(simulated_asymmetry, yKS)
-
-# calculate difference dataset, the maximum of which is the KS test statistic
-dKS = [abs(x-y) for x,y in zip(cKS1, cKS2)]
-# plotting just cdf
-
-fig,ax = plt.subplots(2,1,figsize=(16, 8))
-
-ax[0].plot(yKS,cKS1, label = 'Measured Data')
-ax[0].plot(yKS,cKS2, label = 'Simulated Data')
-ax[1].plot(yKS,dKS, color = "green", label = r'$\Delta$ CDF')
-# Add more ticks on the y-axis
-ax[0].set_yticks(np.arange(0, 1 + 0.2, 0.25))
-ax[1].set_yticks(np.arange(0, max(dKS) + 0.2, 0.25))
-# Add more ticks on the x-axis
-ax[0].set_xticks(np.arange(round(min_value_asymmetry,1)-0.1, round(max_value_asymmetry,1) + 0.1, 0.2))
-ax[1].set_xticks(ax[0].get_xticks())
-ax[0].set_ylabel(r'CDF',fontsize=50)
-ax[1].set_xlabel(r'Production Asymmetry [%]',fontsize=50)
-ax[1].set_ylabel(r'|$\Delta$ CDF| ',fontsize=50)
-# Adding legends
-y,x=max(zip(dKS,yKS))
-ax[1].plot(x,y, 'o', color = 'red', label = r'Maximum $\Delta$ CDF value')
-ax[0].legend(fontsize=30)
-ax[1].legend(fontsize=30)
-if args.scheme == 'pT':
-    plt.savefig(f'{args.path}/pT_KS-Test CDF and DeltaCDF.pdf', bbox_inches = "tight")
-elif args.scheme == 'eta':
-    plt.savefig(f'{args.path}/eta_KS-Test CDF and DeltaCDF.pdf.pdf', bbox_inches = "tight")
-
-# print output
-n1 = len(asymmetry)
-n2 = len(simulated_asymmetry)
-# Calculate KS test statistic and p-value
-ks_statistic, p_value = ks_2samp(asymmetry, simulated_asymmetry)
-
-# Open a text file in write mode
-if args.scheme == 'pT':
-    filename_text_output = f'{args.path}/eta_KS-Test CDF and DeltaCDF.txt'
-elif args.scheme == 'eta':
-    filename_text_output = f'{args.path}/pT_KS-Test CDF and DeltaCDF.txt'
-    
-with open(filename_text_output, "w") as f:
-    # Write the test statistic and p-value to the file
-    f.write("KS-Test Statistic from scipy: {}\n".format(ks_statistic))
-    f.write("p-value from scipy: {}\n".format(p_value))
-
-    # Print the test statistic and p-value to console
-    print("KS-Test Statistic from scipy:", ks_statistic)
-    print("p-value from scipy:", p_value)
-
-    # Print the KS test output to console and write it to the file
-    output = "The KS test output for {0} and {1} entries is D={2:.3f} and d={3:.3f}.\n".format(n1, n2, max(dKS), max(dKS)*(n1*n2/(n1+n2))**0.5)
-    print(output)
-    f.write(output)
\ No newline at end of file
+    ##################
+    # Plotting
+    plt, Rectangle, PolyCollection = setup_plotting()
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(15, 12), sharex=True, gridspec_kw={'height_ratios': [3, 1]})
+
+    ax1.set_ylabel(r'$A_{\mathrm{prod}}$ [%]', fontsize = 50)
+    ax1.tick_params(axis='both', which='both', labelsize=30)
+
+    line2 = ax1.axhline(unbinned_asymm, color='red', linestyle='solid', linewidth=5)
+    fill2 = ax1.axhspan(unbinned_asymm-unbinned_asymm_error, unbinned_asymm+unbinned_asymm_error, color='red', alpha=0.35, lw=0)
+
+    Data = ax1.errorbar(x_value, asymmetry, yerr=asymmetry_error,xerr=x_value_error, fmt='o', capsize=5, color = 'black', label = 'Data')
+
+    # Fill between simulated error bars, one rectangle per bin in a single collection
+    x_lo = x_value - x_value_error
+    x_hi = x_value + x_value_error
+    y_lo = simulated_asymmetry - simulated_asymmetry_error
+    y_hi = simulated_asymmetry + simulated_asymmetry_error
+    verts = np.stack((np.column_stack((x_lo, y_lo)), np.column_stack((x_hi, y_lo)),
+                      np.column_stack((x_hi, y_hi)), np.column_stack((x_lo, y_hi))), axis=1)
+    pc = PolyCollection(verts, facecolor='green', alpha=0.4, linewidth=0)
+    pc.set_rasterized(True)
+    ax1.add_collection(pc)
+    ax1.autoscale_view()
+
+    extra = Rectangle((0, 0), 1, 1, fc="green", fill=True, edgecolor='none', linewidth=0, alpha=0.4)
+
+    # Fit = ax.axhline(values[0], color='purple', linestyle=':', linewidth=5)
+
+    if args.scheme == 'pT':
+        ax1.legend([(line2,fill2),Data, extra],[r'Bin integrated result','Data','Pythia'])#, loc='upper right')
+    elif args.scheme == 'eta':
+        ax1.legend([(line2,fill2),Data, extra],[r'Bin integrated result','Data','Pythia'])#,='upper right')
+
+    file_path = f"{args.path}/result_of_fit.txt"
+    with open(file_path, "w") as file:
+        file.write(result_string)
+
+    # The ratio is undefined where the measured asymmetry is zero; those bins are left as nan so they are not drawn
+    mask = asymmetry != 0
+    ratio = np.full_like(asymmetry, np.nan)
+    np.divide(simulated_asymmetry, asymmetry, out=ratio, where=mask)
+    ratio_error = np.full_like(asymmetry, np.nan)
+    ratio_error[mask] = np.sqrt((simulated_asymmetry_error[mask]/asymmetry[mask])**2 + ((simulated_asymmetry[mask]*asymmetry_error[mask])/(asymmetry[mask])**2)**2)
+
+    # Plot residuals against observed data with error bars
+    ax2.errorbar(x_value, ratio, xerr=x_value_error, yerr=ratio_error, fmt='o', color='black')
+
+    # ax2.errorbar(x_value, ratio, xerr=x_value, yerr=ratio_error, fmt='o', color='black')
+
+    ax2.axhline(y=1, color='grey', linestyle='--') 
+    # ax2.axhline(y=0, color='grey', linestyle='--')  
+    # ax2.axhline(y=-3, color='red', linestyle='--')  
+
+    if args.scheme == 'pT':
+        ax2.set_xlabel(r'$p_{T}$ [GeV$c^{-1}$]', fontsize = 50)
+    elif args.scheme == 'eta':
+        ax2.set_xlabel(r'$\eta$', fontsize = 50)
+    ax2.set_ylabel('Ratio', fontsize = 50)
+
+
+
+    if args.scheme == 'pT':
+        plt.savefig(f'{args.path}/pT_Asymm_{args.year}_{args.size}.pdf', bbox_inches = "tight", dpi = 150, metadata = {'Creator': None, 'Producer': None})
+    elif args.scheme == 'eta':
+        plt.savefig(f'{args.path}/eta_Asymm_{args.year}_{args.size}.pdf', bbox_inches = "tight", dpi = 150, metadata = {'Creator': None, 'Producer': None})
+
+    plt.show()
+    # Release the asymmetry figure before the KS-test figure is built
+    plt.close(fig)
+
+    min_value_asymmetry = min(asymmetry.min(), simulated_asymmetry.min())
+    max_value_asymmetry = max(asymmetry.max(), simulated_asymmetry.max())
+    print(min_value_asymmetry)
+    print(max_value_asymmetry)
+
+    # y axis points for plotting and evaluation of the difference
+    nSamples = 10000
+    yKS = np.linspace(min_value_asymmetry, max_value_asymmetry, nSamples+1)
+
+
+    cKS1 = getCumY(asymmetry, yKS)
+    cKS2 = getCumY(simulated_asymmetry, yKS)
+
+    # calculate difference dataset, the maximum of which is the KS test statistic
+    dKS = [abs(x-y) for x,y in zip(cKS1, cKS2)]
+    # plotting just cdf
+
+    fig,ax = plt.subplots(2,1,figsize=(16, 8))
+
+    ax[0].plot(yKS,cKS1, label = 'Measured Data')
+    ax[0].plot(yKS,cKS2, label = 'Simulated Data')
+    ax[1].plot(yKS,dKS, color = "green", label = r'$\Delta$ CDF')
+    # Add more ticks on the y-axis
+    ax[0].set_yticks(np.arange(0, 1 + 0.2, 0.25))
+    ax[1].set_yticks(np.arange(0, max(dKS) + 0.2, 0.25))
+    # Add more ticks on the x-axis
+    ax[0].set_xticks(np.arange(round(min_value_asymmetry,1)-0.1, round(max_value_asymmetry,1) + 0.1, 0.2))
+    ax[1].set_xticks(ax[0].get_xticks())
+    ax[0].set_ylabel(r'CDF',fontsize=50)
+    ax[1].set_xlabel(r'Production Asymmetry [%]',fontsize=50)
+    ax[1].set_ylabel(r'|$\Delta$ CDF| ',fontsize=50)
+    # Adding legends
+    y,x=max(zip(dKS,yKS))
+    ax[1].plot(x,y, 'o', color = 'red', label = r'Maximum $\Delta$ CDF value')
+    ax[0].legend(fontsize=30)
+    ax[1].legend(fontsize=30)
+    if args.scheme == 'pT':
+        plt.savefig(f'{args.path}/pT_KS-Test CDF and DeltaCDF.pdf', bbox_inches = "tight", metadata = {'Creator': None, 'Producer': None})
+    elif args.scheme == 'eta':
+        plt.savefig(f'{args.path}/eta_KS-Test CDF and DeltaCDF.pdf.pdf', bbox_inches = "tight", metadata = {'Creator': None, 'Producer': None})
+
+    # print output
+    n1 = len(asymmetry)
+    n2 = len(simulated_asymmetry)
+    # Calculate KS test statistic and p-value
+    ks_statistic, p_value = ks_2samp(asymmetry, simulated_asymmetry)
+
+    # Open a text file in write mode
+    if args.scheme == 'pT':
+        filename_text_output = f'{args.path}/eta_KS-Test CDF and DeltaCDF.txt'
+    elif args.scheme == 'eta':
+        filename_text_output = f'{args.path}/pT_KS-Test CDF and DeltaCDF.txt'
+
+    with open(filename_text_output, "w") as f:
+        # Write the test statistic and p-value to the file
+        f.write("KS-Test Statistic from scipy: {}\n".format(ks_statistic))
+        f.write("p-value from scipy: {}\n".format(p_value))
+
+        # Print the test statistic and p-value to console
+        print("KS-Test Statistic from scipy:", ks_statistic)
+        print("p-value from scipy:", p_value)
+
+        # Print the KS test output to console and write it to the file
+        output = "The KS test output for {0} and {1} entries is D={2:.3f} and d={3:.3f}.\n".format(n1, n2, max(dKS), max(dKS)*(n1*n2/(n1+n2))**0.5)
+        print(output)
+        f.write(output)
+
+if __name__ == "__main__":
+    main()